@@ -4,6 +4,7 @@ import PIL
 
 # External packages
 import streamlit as st
+import cv2
 
 # Local Modules
 import settings
@@ -63,11 +64,9 @@ if source_radio == settings.IMAGE:
                     use_column_width=True)
     else:
         if st.sidebar.button('Detect Drowning'):
-            res = model.predict(uploaded_image,
-                                conf=confidence
-                                )
+            res = helper.predict_image(confidence, model, uploaded_image)
             boxes = res[0].boxes
-            res_plotted = res[0].plot()[:, :, ::-1]
+            res_plotted = cv2.cvtColor(res[0].plot(), cv2.COLOR_BGR2RGB)
             st.image(res_plotted, caption='Detected Image',
                         use_column_width=True)
             try:
@@ -41,6 +41,16 @@ VIDEOS_DICT = {
 
 AUDIO_PATH = 'distress.mp3'
 timeout = 6
+# Class id of drowning, and the number of frames in a timeout window it must be detected in to raise an alert
+DROWN_CLS = 0
+MIN_VOTES = 3
+# Minimum seconds between two distress messages
+alert_cooldown = 30
+# Frames per second actually sent to the model, the rest are skipped
+TARGET_FPS = 8
+# Frames sent to the model in one call, and how long to wait (s) to fill a batch
+BATCH_SIZE = 4
+BATCH_TIMEOUT = 0.05
 # ML Model config
 MODEL_DIR = ROOT / 'weights'
 DETECTION_MODEL = MODEL_DIR / 'yolov8n.pt'
@@ -50,6 +60,16 @@ DETECTION_MODEL = MODEL_DIR / 'yolov8n.pt'
 
 SEGMENTATION_MODEL = MODEL_DIR / 'yolov8n-seg.pt'
 
+# Exported model config
+# The model is exported once from the .pt model and reused afterwards,
+# to a TensorRT engine on a CUDA GPU and to OpenVINO on CPU.
+# CALIB_DATA is a dataset yaml pointing at a few hundred pool images,
+# used to calibrate the INT8 quantization.
+ENGINE_PATH = ROOT / 'best.engine'
+OPENVINO_PATH = ROOT / 'best_int8_openvino_model'
+CALIB_DATA = ROOT / 'calib.yaml'
+MODEL_IMGSZ = 416
+
 # Webcam
 WEBCAM_PATH = 0
 
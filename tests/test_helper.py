@@ -0,0 +1,78 @@
+import queue
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+for module in ("ultralytics", "torch", "streamlit", "cv2", "av", "yt_dlp", "twilio"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import helper  # noqa: E402
+
+
+FRAME = np.zeros((32, 32, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Replaces the model with one returning no detections, records the size of each batch."""
+    sizes = []
+
+    def display_detected_frames(predict, images):
+        sizes.append(len(images))
+        return [(image, np.zeros(0, dtype=np.int32)) for image in images]
+
+    monkeypatch.setattr(helper, "_bind_predictor", lambda *args: None)
+    monkeypatch.setattr(helper, "_display_detected_frames", display_detected_frames)
+    monkeypatch.setattr(helper.settings, "BATCH_SIZE", 4)
+    monkeypatch.setattr(helper.settings, "BATCH_TIMEOUT", 1)
+    return sizes
+
+
+def fake_frames(count, error=None):
+    for _ in range(count):
+        yield FRAME.copy()
+    if error is not None:
+        raise error
+
+
+def run_pipeline(frame_source):
+    """Runs the capture and inference threads, returns everything put on the results queue."""
+    frames = queue.Queue(maxsize=helper.settings.BATCH_SIZE)
+    results = queue.Queue()
+    stop = threading.Event()
+    workers = [
+        threading.Thread(target=helper._capture_worker, args=(frame_source, frames, stop, False), daemon=True),
+        threading.Thread(target=helper._inference_worker, args=(0.25, None, frames, results, stop), daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=5)
+    hung = any(worker.is_alive() for worker in workers)
+    stop.set()
+    assert not hung, "the pipeline did not reach the end of the stream"
+    return list(results.queue)
+
+
+def test_end_of_stream_while_filling_a_batch(batches):
+    results = run_pipeline(fake_frames(5))
+    assert batches == [4, 1]
+    assert len(results) == 6
+    assert results[-1] is None
+
+
+def test_end_of_stream_after_a_full_batch(batches):
+    results = run_pipeline(fake_frames(4))
+    assert batches == [4]
+    assert len(results) == 5
+    assert results[-1] is None
+
+
+def test_capture_error_reaches_the_display_loop(batches):
+    results = run_pipeline(fake_frames(2, error=RuntimeError("stream lost")))
+    assert batches == [2]
+    assert isinstance(results[-1], RuntimeError)